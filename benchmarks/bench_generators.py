@@ -0,0 +1,78 @@
+"""
+Throughput benchmark for the password generation modes.
+
+Run from the repository root:
+
+    PYTHONPATH=src:. python benchmarks/bench_generators.py
+"""
+
+import timeit
+from functools import partial
+from typing import Callable, List, Tuple
+
+from generator import generate_password
+from pronounceable import markov_tables, pronounceable_password
+from tokens import generate_tokens
+
+# Tokens per bulk call in the token benchmarks.
+TOKEN_BATCH = 10000
+
+# (label, callable producing one item) for every benchmarked mode.
+CASES: List[Tuple[str, Callable[[], object]]] = [
+    ("generate_password(16)", lambda: generate_password(16)),
+    ("pronounceable_password(16)", lambda: pronounceable_password(16)),
+    (
+        "pronounceable_password(16, symbols)",
+        lambda: pronounceable_password(16, use_symbols=True),
+    ),
+]
+
+# (label, callable producing TOKEN_BATCH items) for the bulk token modes.
+# 30 bytes is a whole number of blocks for every encoding; 32 is the CLI default.
+BULK_CASES: List[Tuple[str, Callable[[], object]]] = [
+    (
+        f"generate_tokens({nbytes}, {encoding})",
+        partial(generate_tokens, TOKEN_BATCH, nbytes, encoding),
+    )
+    for nbytes in (30, 32)
+    for encoding in ("hex", "base32", "base64url")
+] + [
+    (
+        f"generate_tokens(32, {encoding}, prefix, checksum)",
+        partial(generate_tokens, TOKEN_BATCH, 32, encoding, "pf_", True),
+    )
+    for encoding in ("hex", "base64url")
+]
+
+
+def bench(func: Callable[[], object], number: int = 20000, repeat: int = 5) -> float:
+    """
+    Measure how many calls per second `func` sustains.
+
+    Args:
+        func: Zero-argument callable to time.
+        number: Calls per timing run.
+        repeat: Timing runs; the fastest one is reported.
+
+    Returns:
+        float: Calls per second for the best run.
+    """
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    return number / best
+
+
+def main() -> None:
+    """Print the throughput of every benchmarked mode."""
+    # Build the Markov tables up front so training isn't timed.
+    markov_tables()
+
+    for label, func in CASES:
+        print(f"{label:<50} {bench(func):>14,.0f} /s")
+
+    for label, func in BULK_CASES:
+        rate = bench(func, number=50) * TOKEN_BATCH
+        print(f"{label:<50} {rate:>14,.0f} /s")
+
+
+if __name__ == "__main__":
+    main()
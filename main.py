@@ -1,7 +1,32 @@
+import argparse
 import sys
-from typing import Tuple
-from generator import generate_password
-from ui import get_length, get_case, use_digits, pause_action, use_symbols, error_msg
+from contextlib import redirect_stdout
+from functools import partial
+from typing import Callable, List, Optional, TextIO, Tuple
+from batch import (
+    CHUNK_SIZE,
+    TOKEN_CHUNK_SIZE,
+    open_output,
+    start_batch,
+    write_batch,
+)
+from generator import generate_password, generate_passwords, generate_pools
+from profiles import get_profile, load_profiles
+from pronounceable import pronounceable_password
+from strength import policy_entropy
+from tokens import ENCODINGS, generate_tokens
+from ui import (
+    batch_progress,
+    get_batch_count,
+    get_output_file,
+    get_profile_name,
+    get_length,
+    get_case,
+    use_digits,
+    pause_action,
+    use_symbols,
+    error_msg,
+)
 
 
 def generator_params() -> Tuple[int, bool, bool, bool, bool]:
@@ -20,6 +45,140 @@ def generator_params() -> Tuple[int, bool, bool, bool, bool]:
     return length, upper, lower, digits, symbols
 
 
+def batch_params() -> Tuple[int, str, int, bool, bool, bool, bool]:
+    """
+    Prompt user for the batch size, output file and password parameters.
+
+    Returns:
+        Tuple containing the password count, output file path, followed by
+        the same password parameters as `generator_params`.
+    """
+    count = get_batch_count()
+    path = get_output_file()
+    return (count, path) + generator_params()
+
+
+def generate_batch(
+    count: int,
+    path: str,
+    length: int,
+    upper: bool,
+    lower: bool,
+    digits: bool,
+    symbols: bool,
+) -> str:
+    """
+    Generate a batch of passwords into a file while showing live progress.
+
+    Generation runs on a background worker; Ctrl-C stops it after the current
+    chunk, keeping every password that was already written.
+
+    Returns:
+        Summary message describing how many passwords were saved, or why the
+        batch failed.
+    """
+    if generate_pools(upper, lower, digits, symbols)[1] == 0:
+        return "Batch generation failed — no character types selected."
+
+    produce = partial(
+        generate_passwords,
+        length=length,
+        use_upper=upper,
+        use_lower=lower,
+        use_digits=digits,
+        use_symbols=symbols,
+    )
+
+    try:
+        out = open_output(path)
+    except OSError as e:
+        return f"Batch generation failed — could not open {path}: {e}"
+
+    cancelled = False
+    written = 0
+    errors: List[Exception] = []
+    try:
+        with out, batch_progress() as progress:
+            task = progress.add_task("Generating", total=count)
+            worker, stop, errors = start_batch(
+                out, count, produce, lambda n: progress.advance(task, n)
+            )
+            # Join in short slices so Ctrl-C reaches the main thread. The first
+            # Ctrl-C cancels; later ones keep waiting so the worker is never
+            # left writing to a closed file.
+            while True:
+                try:
+                    worker.join(0.1)
+                    if not worker.is_alive():
+                        break
+                except KeyboardInterrupt:
+                    cancelled = True
+                    stop.set()
+            written = int(progress.tasks[task].completed)
+    except OSError as e:
+        # Closing retries any write the worker failed on, so keep the
+        # worker's error if there is one.
+        if not errors:
+            errors.append(e)
+
+    if errors:
+        return (
+            f"Batch generation failed — {written} passwords saved to {path} "
+            f"before an error: {errors[0]}"
+        )
+    if cancelled:
+        return f"Batch cancelled — {written} passwords saved to {path}."
+    return f"Saved {written} passwords to {path}."
+
+
+def profile_params() -> Tuple[str]:
+    """
+    Prompt user to choose a profile from the config file.
+
+    Returns:
+        Tuple containing the chosen profile name, or an empty tuple if no
+        profiles are configured.
+    """
+    profiles = load_profiles()
+    if not profiles:
+        return ()
+    return (get_profile_name(profiles),)
+
+
+def generate_from_profile(name: Optional[str] = None) -> Optional[str]:
+    """
+    Generate a password using a named profile's settings.
+
+    Args:
+        name: Profile to use; None when no profiles could be loaded.
+
+    Returns:
+        The generated password, or None if the profile is unavailable.
+    """
+    if name is None:
+        return None
+    policy = get_profile(name)
+    if policy is None:
+        return None
+    return generate_password(*policy)
+
+
+def generate_pronounceable(
+    length: int, upper: bool, lower: bool, digits: bool, symbols: bool
+) -> Optional[str]:
+    """
+    Generate a pronounceable password and report its entropy.
+
+    Returns:
+        The password followed by its entropy in bits, or None if it could
+        not be generated with the chosen settings.
+    """
+    password, bits = pronounceable_password(length, upper, lower, digits, symbols)
+    if not password:
+        return None
+    return f"{password}  ({bits:.1f} bits of entropy)"
+
+
 def bye() -> None:
     """
     Display farewell message, pause briefly, then exit program gracefully.
@@ -32,6 +191,9 @@ def bye() -> None:
 # Map commands to their handling functions and parameter-gathering functions
 command_map = {
     "generate": (generate_password, generator_params),
+    "batch": (generate_batch, batch_params),
+    "profile": (generate_from_profile, profile_params),
+    "pronounceable": (generate_pronounceable, generator_params),
     "quit": (bye, lambda: ()),
 }
 
@@ -54,7 +216,28 @@ def menu() -> None:
             "generate a password",
             "1",
         ],
-        "quit": ["quit", "leave", "exit", "bye", "qui", "q", "qu", "2"],
+        "batch": [
+            "batch",
+            "bulk",
+            "generate batch",
+            "generate a batch",
+            "2",
+        ],
+        "profile": [
+            "profile",
+            "profiles",
+            "use profile",
+            "use a profile",
+            "3",
+        ],
+        "pronounceable": [
+            "pronounceable",
+            "pronounce",
+            "say",
+            "readable",
+            "4",
+        ],
+        "quit": ["quit", "leave", "exit", "bye", "qui", "q", "qu", "5"],
     }
 
     while True:
@@ -64,7 +247,10 @@ def menu() -> None:
                 """
 Select an Option:
 [1] Generate a password
-[2] Quit
+[2] Generate a batch
+[3] Generate from a profile
+[4] Generate a pronounceable password
+[5] Quit
 
 """
             )
@@ -91,7 +277,132 @@ Select an Option:
             pause_action(0.5, True, True)
 
 
+def with_scores(
+    produce: Callable[[int], List[str]], bits: float, count: int
+) -> List[str]:
+    """
+    Produce `count` items and tag each one with its strength for auditing.
+
+    Returns:
+        Lines of the form "<item>\t<bits>".
+    """
+    return [f"{item}\t{bits:.1f}" for item in produce(count)]
+
+
+def positive_int(value: str) -> int:
+    """
+    argparse type accepting only integers of 1 or more.
+
+    Raises:
+        argparse.ArgumentTypeError: If `value` is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def run_cli(argv: List[str]) -> int:
+    """
+    Generate passwords or tokens non-interactively from command-line arguments.
+
+    Args:
+        argv: Arguments excluding the program name.
+
+    Returns:
+        Process exit code: 0 on success, 1 if generation failed.
+    """
+    parser = argparse.ArgumentParser(
+        prog="passforge", description="Generate passwords without the menu."
+    )
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("-p", "--profile", help="named profile to generate with")
+    mode.add_argument("-t", "--token", choices=ENCODINGS, help="generate tokens")
+    parser.add_argument("-c", "--config", help="profile config file (TOML or JSON)")
+    parser.add_argument(
+        "-n", "--count", type=positive_int, default=1, help="items to make"
+    )
+    parser.add_argument(
+        "-o", "--output", help="file to write results to instead of stdout"
+    )
+    parser.add_argument(
+        "--bytes",
+        type=positive_int,
+        default=32,
+        help="random bytes per token (default 32)",
+    )
+    parser.add_argument("--prefix", default="", help="text prepended to each token")
+    parser.add_argument(
+        "--checksum", action="store_true", help="append a CRC32 to each token"
+    )
+    parser.add_argument(
+        "--score", action="store_true", help="append entropy in bits to each line"
+    )
+    args = parser.parse_args(argv)
+
+    # The ui helpers print diagnostics to sys.stdout; in scripted mode stdout
+    # must carry generated items only, so send everything else to stderr.
+    stdout = sys.stdout
+    with redirect_stdout(sys.stderr):
+        return cli_generate(args, stdout)
+
+
+def cli_generate(args: argparse.Namespace, stdout: TextIO) -> int:
+    """
+    Produce the items requested on the command line.
+
+    Args:
+        args: Parsed `run_cli` arguments.
+        stdout: Stream generated items are written to when no --output is set.
+
+    Returns:
+        Process exit code: 0 on success, 1 if generation failed.
+    """
+    if args.token is not None:
+        produce = partial(
+            generate_tokens,
+            nbytes=args.bytes,
+            encoding=args.token,
+            prefix=args.prefix,
+            checksum=args.checksum,
+        )
+        # Tokens are cheap to make, so write them in much larger chunks.
+        chunk_size = TOKEN_CHUNK_SIZE
+        # Prefix and checksum are deterministic; only the random bytes count.
+        bits = 8.0 * args.bytes
+    else:
+        policy = get_profile(args.profile, args.config)
+        if policy is None:
+            return 1
+        produce = partial(generate_passwords, **policy._asdict())
+        chunk_size = CHUNK_SIZE
+        bits = policy_entropy(policy)
+
+    if args.score:
+        produce = partial(with_scores, produce, bits)
+
+    if args.output is None:
+        written = write_batch(stdout, args.count, produce, chunk_size=chunk_size)
+    else:
+        try:
+            with open_output(args.output) as out:
+                written = write_batch(out, args.count, produce, chunk_size=chunk_size)
+        except OSError as e:
+            error_msg(f"Could not write to {args.output}: {e}")
+            return 1
+
+    # A producer that refuses (invalid settings) stops the batch short.
+    return 0 if written == args.count else 1
+
+
 if __name__ == "__main__":
+    # Any arguments select the scripted path; otherwise run the menu.
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
+
     print("Welcome to Passforge\n")
     input("Press any key to continue! ")
     pause_action(1.5, True, False)
@@ -0,0 +1,166 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor
+from functools import partial
+from typing import AsyncIterator, List, Optional
+
+from src.generator import Policy, generate_passwords
+
+# Passwords generated per executor call. Each await hands back a whole batch,
+# so the event loop only wakes up once per batch instead of once per password.
+BATCH_SIZE = 1024
+# Passwords generated between GIL hand-backs inside a worker (well under 1ms).
+SLICE_SIZE = 8
+
+
+def generate_sliced(
+    policy: Policy, count: int, stop: Optional[threading.Event] = None
+) -> List[str]:
+    """
+    Generate `count` passwords on a worker thread without starving the loop.
+
+    Generation is pure Python and holds the GIL, so a worker running flat out
+    would only let the event loop in every switch interval (5ms by default).
+    Sleeping for zero seconds after each small slice hands the GIL back
+    promptly instead.
+
+    Args:
+        policy: Settings every password is generated with.
+        count: Number of passwords to generate.
+        stop: Event that ends generation after the current slice when set.
+
+    Returns:
+        A list of `count` passwords; fewer if `stop` was set, or an empty
+        list if the policy selects no character categories.
+    """
+    passwords: List[str] = []
+    while len(passwords) < count:
+        if stop is not None and stop.is_set():
+            break
+        chunk = generate_passwords(min(SLICE_SIZE, count - len(passwords)), *policy)
+        if not chunk:
+            break
+        passwords.extend(chunk)
+        time.sleep(0)
+    return passwords
+
+
+async def aiter_batches(
+    policy: Policy = Policy(),
+    count: Optional[int] = None,
+    batch_size: int = BATCH_SIZE,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[List[str]]:
+    """
+    Yield batches of passwords generated off the event loop.
+
+    While the caller handles one batch, the next one is already being
+    generated on the executor. Cancelling the consumer, or closing the
+    iterator early, stops that prefetched batch: a job that is still queued
+    is cancelled, and one that is already running stops after its current
+    slice.
+
+    Args:
+        policy: Settings every password is generated with.
+        count: Total passwords to produce; None means never stop.
+        batch_size: Passwords generated per executor call.
+        executor: Executor to run generation on; None uses the loop's default.
+
+    Yields:
+        Lists of at most `batch_size` passwords. Stops early if the policy
+        selects no character categories.
+    """
+    loop = asyncio.get_running_loop()
+    # Executor jobs can't be cancelled once running, so they poll this.
+    stop = threading.Event()
+    produce = partial(generate_sliced, policy, stop=stop)
+    remaining = count
+
+    def submit() -> Optional[asyncio.Future]:
+        if remaining is not None and remaining <= 0:
+            return None
+        n = batch_size if remaining is None else min(batch_size, remaining)
+        return loop.run_in_executor(executor, produce, n)
+
+    pending = submit()
+    try:
+        while pending is not None:
+            batch = await pending
+            pending = None
+            if not batch:
+                return
+
+            if remaining is not None:
+                remaining -= len(batch)
+            # Start the next batch before handing this one to the caller.
+            pending = submit()
+            yield batch
+    finally:
+        stop.set()
+        if pending is not None:
+            pending.cancel()
+
+
+async def aiter_passwords(
+    policy: Policy = Policy(),
+    count: Optional[int] = None,
+    batch_size: int = BATCH_SIZE,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[str]:
+    """
+    Asynchronously iterate over generated passwords one at a time.
+
+    A thin wrapper over `aiter_batches`; see it for prefetching and
+    cancellation behaviour.
+
+    Args:
+        policy: Settings every password is generated with.
+        count: Total passwords to produce; None means never stop.
+        batch_size: Passwords generated per executor call.
+        executor: Executor to run generation on; None uses the loop's default.
+
+    Yields:
+        Individual passwords.
+    """
+    batches = aiter_batches(policy, count, batch_size, executor)
+    try:
+        async for batch in batches:
+            for password in batch:
+                yield password
+    finally:
+        await batches.aclose()
+
+
+async def agenerate_passwords(
+    count: int,
+    length: int = 16,
+    use_upper: bool = True,
+    use_lower: bool = True,
+    use_digits: bool = True,
+    use_symbols: bool = True,
+    batch_size: int = BATCH_SIZE,
+    executor: Optional[Executor] = None,
+) -> List[str]:
+    """
+    Awaitable counterpart of `generate_passwords`.
+
+    Args:
+        count: Number of passwords to generate.
+        length: Desired password length.
+        use_upper: Whether uppercase letters are allowed.
+        use_lower: Whether lowercase letters are allowed.
+        use_digits: Whether digits are allowed.
+        use_symbols: Whether symbols are allowed.
+        batch_size: Passwords generated per executor call.
+        executor: Executor to run generation on; None uses the loop's default.
+
+    Returns:
+        A list of `count` passwords, or an empty list if no character
+        categories were selected.
+    """
+    policy = Policy(length, use_upper, use_lower, use_digits, use_symbols)
+    passwords: List[str] = []
+    async for batch in aiter_batches(policy, count, batch_size, executor):
+        passwords.extend(batch)
+    return passwords
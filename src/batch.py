@@ -0,0 +1,106 @@
+import os
+import threading
+from typing import Callable, List, Optional, TextIO, Tuple
+
+# Passwords produced per write; small enough that a cancel request is noticed
+# quickly, large enough that file writes stay cheap.
+CHUNK_SIZE = 256
+# Tokens come from one bulk read per chunk, so bigger chunks amortise it.
+TOKEN_CHUNK_SIZE = 65536
+
+
+def open_output(path: str) -> TextIO:
+    """
+    Open `path` for writing generated secrets, truncating any existing file.
+
+    A new file is created readable and writable by its owner only (0600),
+    instead of the umask default that lets other users read it.
+
+    Raises:
+        OSError: If the file cannot be created or opened.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    return os.fdopen(fd, "w", encoding="utf-8")
+
+
+def write_batch(
+    out: TextIO,
+    count: int,
+    produce: Callable[[int], List[str]],
+    stop: Optional[threading.Event] = None,
+    on_progress: Optional[Callable[[int], None]] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """
+    Write `count` generated passwords to `out`, one per line.
+
+    Passwords are produced and written in chunks. Each chunk is flushed before
+    the next one starts, so everything reported through `on_progress` is
+    already on disk if the batch is stopped early.
+
+    Args:
+        out: Open text file to write to.
+        count: Total number of passwords to write.
+        produce: Callable returning a list of `n` passwords when called with `n`.
+        stop: Event that ends the batch after the current chunk when set.
+        on_progress: Called with the size of each chunk once it is written.
+        chunk_size: Maximum number of passwords produced per chunk.
+
+    Returns:
+        The number of passwords actually written.
+    """
+    written = 0
+
+    while written < count:
+        if stop is not None and stop.is_set():
+            break
+
+        lines = produce(min(chunk_size, count - written))
+        # Producer refused (e.g. no character categories) → nothing more to do.
+        if not lines:
+            break
+
+        out.write("\n".join(lines) + "\n")
+        out.flush()
+        written += len(lines)
+
+        if on_progress is not None:
+            on_progress(len(lines))
+
+    return written
+
+
+def start_batch(
+    out: TextIO,
+    count: int,
+    produce: Callable[[int], List[str]],
+    on_progress: Optional[Callable[[int], None]] = None,
+) -> Tuple[threading.Thread, threading.Event, List[Exception]]:
+    """
+    Run `write_batch` on a background worker thread.
+
+    Args:
+        out: Open text file to write to.
+        count: Total number of passwords to write.
+        produce: Callable returning a list of `n` passwords when called with `n`.
+        on_progress: Called from the worker with the size of each written chunk.
+
+    Returns:
+        (worker, stop, errors):
+            worker — the started thread; join it to wait for the batch.
+            stop — event to set to cancel the batch after the current chunk.
+            errors — receives the exception that ended the worker early, if
+            any (e.g. a full disk); check it once the worker has finished.
+    """
+    stop = threading.Event()
+    errors: List[Exception] = []
+
+    def run() -> None:
+        try:
+            write_batch(out, count, produce, stop, on_progress)
+        except Exception as e:
+            errors.append(e)
+
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
+    return worker, stop, errors
@@ -1,6 +1,6 @@
 import secrets
 import string
-from typing import Tuple
+from typing import List, NamedTuple, Tuple
 
 from src.ui import error_msg
 
@@ -8,6 +8,21 @@ remove = {'"', "'", "(", ")", "+", ",", "[", "]", "{", "}"}
 symbols_pool = "".join(c for c in string.punctuation if c not in remove)
 
 
+class Policy(NamedTuple):
+    """
+    Reusable set of password parameters.
+
+    Field order matches `generate_password`, so a policy can be splatted
+    straight into it: `generate_password(*policy)`.
+    """
+
+    length: int = 16
+    use_upper: bool = True
+    use_lower: bool = True
+    use_digits: bool = True
+    use_symbols: bool = True
+
+
 def generate_pools(
     use_upper: bool, use_lower: bool, use_digits: bool, use_symbols: bool
 ) -> Tuple:
@@ -133,3 +148,39 @@ def generate_password(
 
     password = "".join(passwd)
     return password
+
+
+def generate_passwords(
+    count: int,
+    length: int = 16,
+    use_upper: bool = True,
+    use_lower: bool = True,
+    use_digits: bool = True,
+    use_symbols: bool = True,
+) -> List[str]:
+    """
+    Generate several passwords that share the same settings.
+
+    The category selection is validated once up front, so an empty selection
+    reports a single error instead of one per password.
+
+    Args:
+        count: Number of passwords to generate.
+        length: Desired password length.
+        use_upper: Whether uppercase letters are allowed.
+        use_lower: Whether lowercase letters are allowed.
+        use_digits: Whether digits are allowed.
+        use_symbols: Whether symbols are allowed.
+
+    Returns:
+        A list of `count` passwords, or an empty list if no character
+        categories were selected.
+    """
+    _, num_true = generate_pools(use_upper, use_lower, use_digits, use_symbols)
+    if num_true == 0:
+        return []
+
+    return [
+        generate_password(length, use_upper, use_lower, use_digits, use_symbols)
+        for _ in range(count)
+    ]
@@ -0,0 +1,194 @@
+import json
+import os
+import tomllib
+from typing import Any, Dict, Optional, Tuple
+
+from src.generator import Policy
+from src.ui import error_msg
+
+# Config keys accepted for each profile, mapped to their `Policy` field.
+PROFILE_KEYS = {
+    "length": "length",
+    "upper": "use_upper",
+    "lower": "use_lower",
+    "digits": "use_digits",
+    "symbols": "use_symbols",
+}
+
+# Absolute config path → (mtime_ns, size, compiled profiles, invalid profiles).
+_cache: Dict[str, Tuple[int, int, Dict[str, Policy], Dict[str, str]]] = {}
+
+
+def default_config_path() -> str:
+    """Return the profile config path, honouring $PASSFORGE_CONFIG."""
+    return os.environ.get("PASSFORGE_CONFIG", "passforge.toml")
+
+
+def check_profile(name: str, settings: Any) -> Optional[str]:
+    """
+    Validate one profile's settings.
+
+    Args:
+        name: Profile name, used in error messages.
+        settings: Mapping of config keys (length, upper, lower, digits, symbols).
+
+    Returns:
+        A description of the first problem found, or None if the settings
+        are valid.
+    """
+    if not isinstance(settings, dict):
+        return f"Profile '{name}' must be a table of settings!"
+
+    unknown = set(settings) - set(PROFILE_KEYS)
+    if unknown:
+        return f"Profile '{name}' has unknown settings: {', '.join(sorted(unknown))}"
+
+    policy = Policy(**{PROFILE_KEYS[key]: value for key, value in settings.items()})
+
+    # bool is a subclass of int, so reject it explicitly for the length.
+    if not isinstance(policy.length, int) or isinstance(policy.length, bool):
+        return f"Profile '{name}' needs an integer length!"
+    if policy.length <= 6:
+        return f"Profile '{name}' length must be greater than 6!"
+    if not all(isinstance(flag, bool) for flag in policy[1:]):
+        return f"Profile '{name}' character settings must be true or false!"
+    if not any(policy[1:]):
+        return f"Profile '{name}' doesn't select any character categories!"
+    return None
+
+
+def compile_profile(name: str, settings: Dict[str, Any]) -> Optional[Policy]:
+    """
+    Validate one profile's settings and turn them into a `Policy`.
+
+    Missing keys fall back to the `generate_password` defaults.
+
+    Args:
+        name: Profile name, used in error messages.
+        settings: Mapping of config keys (length, upper, lower, digits, symbols).
+
+    Returns:
+        The compiled policy, or None (with an error emitted) if the settings
+        are invalid.
+    """
+    problem = check_profile(name, settings)
+    if problem is not None:
+        error_msg(problem)
+        return None
+    return Policy(**{PROFILE_KEYS[key]: value for key, value in settings.items()})
+
+
+def parse_config(path: str) -> Tuple[Optional[Dict[str, Policy]], Dict[str, str]]:
+    """
+    Read a TOML or JSON config file and compile every valid profile in it.
+
+    Profiles live under a top-level `profiles` table, e.g. `[profiles.wifi]`
+    in TOML. Files ending in `.json` are parsed as JSON, anything else as TOML.
+    Read and parse failures are reported straight away; problems with
+    individual profiles are returned instead so the caller decides when to
+    show them.
+
+    Args:
+        path: Config file to read.
+
+    Returns:
+        (profiles, problems):
+            profiles — mapping of profile name → compiled policy, or None if
+            the file could not be read or parsed.
+            problems — mapping of invalid profile name → error message.
+    """
+    try:
+        if path.endswith(".json"):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        else:
+            with open(path, "rb") as f:
+                data = tomllib.load(f)
+    except OSError as e:
+        error_msg(f"Could not read profile config {path}: {e}")
+        return None, {}
+    except (ValueError, tomllib.TOMLDecodeError) as e:
+        error_msg(f"Profile config {path} is malformed: {e}")
+        return None, {}
+
+    raw = data.get("profiles", {}) if isinstance(data, dict) else None
+    if not isinstance(raw, dict):
+        error_msg(f"Profile config {path} needs a 'profiles' table!")
+        return None, {}
+
+    profiles = {}
+    problems = {}
+    for name, settings in raw.items():
+        problem = check_profile(name, settings)
+        if problem is None:
+            profiles[name] = Policy(
+                **{PROFILE_KEYS[key]: value for key, value in settings.items()}
+            )
+        else:
+            problems[name] = problem
+    return profiles, problems
+
+
+def load_profiles(path: Optional[str] = None) -> Dict[str, Policy]:
+    """
+    Return the compiled profiles for a config file, parsing it only if needed.
+
+    Results are cached per file and reused until the file's modification time
+    or size changes, so repeated lookups cost a single `stat` call. Invalid
+    profiles are reported once per version of the file. Files that cannot be
+    read or parsed are not cached, so that error is shown on every lookup.
+
+    Args:
+        path: Config file to load; defaults to `default_config_path()`.
+
+    Returns:
+        Mapping of profile name → compiled policy.
+    """
+    path = os.path.abspath(path or default_config_path())
+
+    try:
+        st = os.stat(path)
+    except OSError as e:
+        _cache.pop(path, None)
+        error_msg(f"Could not read profile config {path}: {e.strerror}")
+        return {}
+
+    cached = _cache.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    profiles, problems = parse_config(path)
+    if profiles is None:
+        _cache.pop(path, None)
+        return {}
+
+    for problem in problems.values():
+        error_msg(problem)
+    _cache[path] = (st.st_mtime_ns, st.st_size, profiles, problems)
+    return profiles
+
+
+def get_profile(name: str, path: Optional[str] = None) -> Optional[Policy]:
+    """
+    Look up a single compiled profile by name.
+
+    Args:
+        name: Profile name, e.g. "wifi".
+        path: Config file to load; defaults to `default_config_path()`.
+
+    Returns:
+        The profile's policy, or None (with an error emitted) if it is unknown.
+    """
+    profiles = load_profiles(path)
+    policy = profiles.get(name)
+    if policy is not None:
+        return policy
+
+    # Asking for an invalid profile by name deserves its specific error.
+    cached = _cache.get(os.path.abspath(path or default_config_path()))
+    if cached is not None and name in cached[3]:
+        error_msg(cached[3][name])
+    else:
+        available = ", ".join(profiles) or "none"
+        error_msg(f"Unknown profile '{name}'! Available profiles: {available}")
+    return None
@@ -0,0 +1,367 @@
+import math
+import secrets
+import string
+from array import array
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Tuple
+
+from src.generator import symbols_pool
+from src.ui import error_msg
+
+# Training words for the letter model. Short, common words keep the output
+# easy to say while still giving every context several possible successors.
+CORPUS = """
+able about above across act add after again against age ago air all almost
+alone along already also always among animal another answer any appear apple
+area arm around art ask away baby back bad bag ball band bank base basket bear
+beat beautiful become bed before begin behind believe below best better
+between big bird black blood blue board boat body bone book border born both
+bottom box boy brain branch bread break bring brother brown build burn busy
+but buy cabin call camera camp can capital captain car card care carry case
+cat catch cause cell center century certain chair chance change character
+charge check child children choose circle city class clean clear climb clock
+close cloud coast cold color come common company complete condition consider
+contain continue control cook cool copper corner cost cotton could count
+country course cover cow create crop cross crowd cry current cut dance danger
+dark day dead deal dear decide deep degree depend describe desert design
+detail develop differ dinner direct discover distant divide doctor dollar
+done door double down draw dream dress drink drive drop during dust duty each
+early earth east easy eat edge effect eight either electric element else end
+enemy energy engine enough enter equal even evening event ever every exact
+example except excite expect experience explain eye face fact fall family
+famous far farm fast father favor fear feed feel fellow felt few field fight
+figure fill final find fine finger finish fire first fish five flat floor
+flower fly follow food foot forest form forward found four free fresh friend
+front fruit full funny garden gather general gentle giant girl give glass
+gold golden good govern grand grass gray great green ground group grow guess
+guide gun hair half hand happen happy hard harbor have head hear heart heat
+heavy held help here hero high hill history hold hole home honor hope horse
+hospital hot hour house huge human humor hundred hunt hurry idea imagine inch
+include indeed industry insect instant instrument interest iron island jacket
+jelly join joke journey judge jump jungle just keep kettle kind king kitchen
+kitten know label labor ladder lake land language large last later laugh law
+lay lead learn least leave lemon less letter level library light like limit
+line lion liquid listen little live local lonely long look lose loud love low
+machine magic magnet main major make manner many map march market master
+matter meadow measure meet melody member memory metal middle might mile
+milk million mind minute mirror modern moment money monkey month moon more
+morning mother motion motor mountain mouse move music name nation native
+nature near necessary needle never next nice night nine noble noise normal
+north nothing notice novel number object ocean offer office often olive
+open opera orange order ordinary organ other over owner oxygen paper parent
+party pass pattern peace pencil people pepper perfect perhaps period person
+picture piece pilot planet plant plenty pocket poem point polite pony
+popular position possible potato power present pretty print problem promise
+proper protect proud public purple quarter question quick quiet rabbit race
+radio rain raise rapid rather reach ready reason record region remember
+repeat river road robot rocket round rubber ruler salad salt same sand
+season second seed select semester seven shadow shelter shine shoulder
+silver simple sister sleep slender slow small smile snow soldier solid
+someone soon sound south space special spider spirit spring square stand
+station steady stone story strange street strong student subject sugar
+summer sunset super supper surface system table talent target teacher
+temper tender thunder tiger timber today together tomato tomorrow total
+travel tribe triple tunnel turtle twenty under unit until valley value
+velvet village violet visit voice wagon walnut water weather welcome window
+winter wisdom wonder wooden yellow yesterday zebra
+"""
+
+START = "^"
+
+
+def injected_pools(use_digits: bool, use_symbols: bool) -> List[str]:
+    """Return the non-letter pools that get one character inserted each."""
+    pools = []
+    if use_digits:
+        pools.append(string.digits)
+    if use_symbols:
+        pools.append(symbols_pool)
+    return pools
+
+
+class MarkovTables(NamedTuple):
+    """
+    Flat, precomputed transition tables for an n-gram letter model.
+
+    Every context owns a contiguous run of entries, starting at
+    `offsets[ctx]` and `sizes[ctx]` long. Each entry describes one possible
+    next letter together with its alias-method slot and the context that
+    follows it, so sampling a character is a constant number of lookups.
+    """
+
+    start: int
+    offsets: array
+    sizes: array
+    totals: array
+    chars: array
+    threshold: array
+    alias: array
+    info: array
+    following: array
+
+
+def build_alias(counts: List[int]) -> Tuple[List[int], List[int]]:
+    """
+    Build an exact integer alias table for a discrete distribution.
+
+    Outcome `i` has probability `counts[i] / sum(counts)`. Sampling picks a
+    slot `j` uniformly and a value `u` below the total; the outcome is `j` if
+    `u < threshold[j]`, otherwise `alias[j]`. Working in integers keeps the
+    sampled probabilities exact.
+
+    Args:
+        counts: Positive weight for each outcome.
+
+    Returns:
+        (threshold, alias): per-slot acceptance threshold and fallback outcome.
+    """
+    k = len(counts)
+    total = sum(counts)
+    scaled = [c * k for c in counts]
+    threshold = [total] * k
+    alias = list(range(k))
+
+    small = [i for i, p in enumerate(scaled) if p < total]
+    large = [i for i, p in enumerate(scaled) if p >= total]
+
+    while small and large:
+        s = small.pop()
+        g = large.pop()
+        threshold[s] = scaled[s]
+        alias[s] = g
+        # The large outcome donates what the small slot was missing.
+        scaled[g] -= total - scaled[s]
+        (small if scaled[g] < total else large).append(g)
+
+    return threshold, alias
+
+
+@lru_cache(maxsize=None)
+def markov_tables(order: int = 3) -> MarkovTables:
+    """
+    Train an n-gram letter model on `CORPUS` and compile it into flat arrays.
+
+    Contexts are the previous `order - 1` letters, padded with `START` at the
+    beginning of a word. Word endings are not modelled: a context that only
+    ever ends a word leads back to the start context instead, so a generated
+    string always determines the exact path that produced it.
+
+    Args:
+        order: n-gram order, at least 2 (2 = bigram, 3 = trigram, ...).
+
+    Returns:
+        The compiled tables; built once per order and then cached.
+    """
+    width = order - 1
+    transitions: Dict[str, Dict[str, int]] = {}
+
+    for word in CORPUS.split():
+        padded = START * width + word
+        for i in range(len(word)):
+            context = padded[i : i + width]
+            nxt = padded[i + width]
+            successors = transitions.setdefault(context, {})
+            successors[nxt] = successors.get(nxt, 0) + 1
+
+    contexts = sorted(transitions)
+    index = {context: i for i, context in enumerate(contexts)}
+    start = index[START * width]
+
+    offsets, sizes, totals = array("I"), array("H"), array("I")
+    chars, threshold, alias = array("B"), array("I"), array("B")
+    info, following = array("d"), array("I")
+
+    for context in contexts:
+        successors = sorted(transitions[context].items())
+        counts = [c for _, c in successors]
+        total = sum(counts)
+        slot_threshold, slot_alias = build_alias(counts)
+
+        offsets.append(len(chars))
+        sizes.append(len(counts))
+        totals.append(total)
+        for (letter, count), t, a in zip(successors, slot_threshold, slot_alias):
+            chars.append(ord(letter))
+            threshold.append(t)
+            alias.append(a)
+            info.append(math.log2(total / count))
+            following.append(index.get((context + letter)[-width:], start))
+
+    return MarkovTables(
+        start, offsets, sizes, totals, chars, threshold, alias, info, following
+    )
+
+
+def sample_letters(length: int, tables: MarkovTables) -> Tuple[str, float]:
+    """
+    Walk the Markov chain for `length` letters using cryptographic randomness.
+
+    Each step draws a single `secrets.randbelow` value that is split into the
+    alias slot and the acceptance test, so every character costs O(1).
+
+    Args:
+        length: Number of letters to produce.
+        tables: Compiled model from `markov_tables`.
+
+    Returns:
+        (letters, bits): the lowercase letters and their self-information,
+        i.e. -log2 of the probability of producing exactly this string.
+    """
+    offsets, sizes, totals = tables.offsets, tables.sizes, tables.totals
+    chars, threshold, alias = tables.chars, tables.threshold, tables.alias
+    info, following = tables.info, tables.following
+    randbelow = secrets.randbelow
+
+    out = bytearray()
+    bits = 0.0
+    ctx = tables.start
+
+    for _ in range(length):
+        base = offsets[ctx]
+        total = totals[ctx]
+        slot, u = divmod(randbelow(sizes[ctx] * total), total)
+        entry = base + slot
+        if u >= threshold[entry]:
+            entry = base + alias[entry]
+
+        out.append(chars[entry])
+        bits += info[entry]
+        ctx = following[entry]
+
+    return out.decode("ascii"), bits
+
+
+@lru_cache(maxsize=None)
+def letters_entropy(length: int, order: int = 3) -> float:
+    """
+    Exact Shannon entropy, in bits, of `sample_letters(length)`.
+
+    The chain's state is fully determined by the letters already produced,
+    so the entropy is the sum over steps of the expected per-step entropy.
+    That expectation is computed by propagating the distribution over
+    contexts one step at a time.
+
+    Args:
+        length: Number of letters produced.
+        order: n-gram order of the model.
+
+    Returns:
+        Entropy of the letter string in bits.
+    """
+    tables = markov_tables(order)
+    n_contexts = len(tables.offsets)
+
+    # Per-context entropy and successor probabilities, computed once.
+    step_entropy = []
+    moves = []
+    for ctx in range(n_contexts):
+        base, k = tables.offsets[ctx], tables.sizes[ctx]
+        entries = range(base, base + k)
+        probs = [2.0 ** -tables.info[e] for e in entries]
+        step_entropy.append(sum(p * tables.info[e] for p, e in zip(probs, entries)))
+        moves.append([(tables.following[e], p) for p, e in zip(probs, entries)])
+
+    dist = [0.0] * n_contexts
+    dist[tables.start] = 1.0
+    bits = 0.0
+
+    for _ in range(length):
+        bits += sum(p * h for p, h in zip(dist, step_entropy) if p)
+        nxt = [0.0] * n_contexts
+        for ctx, p in enumerate(dist):
+            if p:
+                for target, q in moves[ctx]:
+                    nxt[target] += p * q
+        dist = nxt
+
+    return bits
+
+
+def pronounceable_password(
+    length: int = 16,
+    use_upper: bool = True,
+    use_lower: bool = True,
+    use_digits: bool = True,
+    use_symbols: bool = False,
+    order: int = 3,
+) -> Tuple[str, float]:
+    """
+    Generate an easy-to-say password from the n-gram letter model.
+
+    The algorithm:
+    1. Samples letters from the Markov chain (O(1) per character).
+    2. Applies the letter case: capitalises the first letter when both cases
+       are enabled, or uses a single case otherwise.
+    3. Inserts one character from each enabled non-letter pool at a random
+       position, so every `generate_pools` category appears.
+
+    Args:
+        length: Desired password length.
+        use_upper: Whether uppercase letters are allowed.
+        use_lower: Whether lowercase letters are allowed.
+        use_digits: Insert one digit.
+        use_symbols: Insert one symbol.
+        order: n-gram order of the letter model.
+
+    Returns:
+        (password, bits): the password and its self-information in bits.
+        Each choice is counted exactly once, since no two choice sequences
+        give the same password. Returns ("", 0.0) and emits an error if
+        letters are disabled or the length is too short.
+    """
+    if not (use_upper or use_lower):
+        error_msg("Pronounceable passwords need letters!")
+        return "", 0.0
+
+    active_pools = injected_pools(use_digits, use_symbols)
+    n_letters = length - len(active_pools)
+    if n_letters < 1:
+        error_msg("Password is too short for the selected character types!")
+        return "", 0.0
+
+    letters, bits = sample_letters(n_letters, markov_tables(order))
+
+    if use_upper and use_lower:
+        letters = letters.capitalize()
+    elif use_upper:
+        letters = letters.upper()
+
+    passwd = list(letters)
+    for pool in active_pools:
+        pos = secrets.randbelow(len(passwd) + 1)
+        passwd.insert(pos, secrets.choice(pool))
+        bits += math.log2(len(passwd)) + math.log2(len(pool))
+
+    return "".join(passwd), bits
+
+
+def pronounceable_entropy(
+    length: int = 16,
+    use_digits: bool = True,
+    use_symbols: bool = False,
+    order: int = 3,
+) -> float:
+    """
+    Exact Shannon entropy, in bits, of `pronounceable_password` output.
+
+    Letter case is deterministic and adds nothing; each inserted character
+    adds the log of its position count and pool size.
+
+    Args:
+        length: Password length.
+        use_digits: Whether a digit is inserted.
+        use_symbols: Whether a symbol is inserted.
+        order: n-gram order of the letter model.
+
+    Returns:
+        Entropy in bits, or 0.0 if the length is too short.
+    """
+    active_pools = injected_pools(use_digits, use_symbols)
+    n_letters = length - len(active_pools)
+    if n_letters < 1:
+        return 0.0
+
+    bits = letters_entropy(n_letters, order)
+    for i, pool in enumerate(active_pools, start=1):
+        bits += math.log2(n_letters + i) + math.log2(len(pool))
+    return bits
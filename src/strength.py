@@ -0,0 +1,296 @@
+import math
+import string
+from functools import lru_cache
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.generator import Policy, generate_pools
+
+# Keyboard rows used to spot "qwerty"-style walks.
+KEYBOARD_ROWS = ("`1234567890-=", "qwertyuiop[]\\", "asdfghjkl;'", "zxcvbnm,./")
+
+# Printable ASCII punctuation, for scoring strings from outside passforge.
+PUNCTUATION_SIZE = len(string.punctuation)
+
+# Every character mapped to a one-letter class tag, so `str.translate`
+# classifies a whole string in a single C-level pass.
+CLASS_TABLE = str.maketrans(
+    {
+        **{c: "u" for c in string.ascii_uppercase},
+        **{c: "l" for c in string.ascii_lowercase},
+        **{c: "d" for c in string.digits},
+        **{c: "s" for c in string.punctuation},
+    }
+)
+CLASS_SIZES = {"u": 26, "l": 26, "d": 10, "s": PUNCTUATION_SIZE}
+# Anything else (spaces, non-ASCII) is treated as a large, sparse alphabet.
+OTHER_SIZE = 100
+
+# Shortest block that counts as repeating earlier text ("abc" in "abcXabc").
+MIN_REPEAT = 3
+
+
+def predictable_pairs() -> frozenset:
+    """
+    Build every two-character sequence that a guesser would try early.
+
+    Covers repeats ("aa"), alphabetical and numeric steps in either direction
+    ("ab", "ba", "12", "21") and neighbours on a keyboard row ("qw", "wq").
+    Letters are matched case-insensitively by adding both cases.
+
+    Returns:
+        frozenset: Two-character strings whose second character is predictable.
+    """
+    pairs = set()
+    for c in string.printable:
+        pairs.add(c + c)
+
+    runs = (string.ascii_lowercase, string.ascii_uppercase, string.digits)
+    for run in runs + KEYBOARD_ROWS + tuple(r.upper() for r in KEYBOARD_ROWS):
+        for a, b in zip(run, run[1:]):
+            pairs.add(a + b)
+            pairs.add(b + a)
+    return frozenset(pairs)
+
+
+PREDICTABLE = predictable_pairs()
+
+
+def count_vectors(length: int, num_pools: int) -> Dict[Tuple[int, ...], float]:
+    """
+    Distribution of per-pool character counts produced by `generate_password`.
+
+    Replays its allocation exactly: one character per pool, an even base
+    share, random extras drawn from the leftover pool by pool, then any
+    shortfall filled one character at a time from a random pool.
+
+    Args:
+        length: Requested password length.
+        num_pools: Number of enabled character pools.
+
+    Returns:
+        Mapping of count vector → probability.
+    """
+    remaining = length - num_pools
+    base = remaining // num_pools
+    leftover = remaining - base * num_pools
+
+    # Walk the pools, branching on every possible `extra` draw.
+    states = {((1,) * num_pools, leftover): 1.0}
+    for i in range(num_pools):
+        nxt: Dict[Tuple[Tuple[int, ...], int], float] = {}
+        for (counts, left), p in states.items():
+            extras = range(left + 1) if left > 0 else (0,)
+            for extra in extras:
+                new = list(counts)
+                new[i] += max(0, base + extra)
+                key = (tuple(new), left - extra)
+                nxt[key] = nxt.get(key, 0.0) + p / len(extras)
+        states = nxt
+
+    dist: Dict[Tuple[int, ...], float] = {}
+    for (counts, _), p in states.items():
+        # Each missing character goes to a uniformly random pool.
+        missing = max(0, length - sum(counts))
+        fills = {counts: p}
+        for _ in range(missing):
+            step: Dict[Tuple[int, ...], float] = {}
+            for vec, q in fills.items():
+                for i in range(num_pools):
+                    new = list(vec)
+                    new[i] += 1
+                    key = tuple(new)
+                    step[key] = step.get(key, 0.0) + q / num_pools
+            fills = step
+        for vec, q in fills.items():
+            dist[vec] = dist.get(vec, 0.0) + q
+    return dist
+
+
+@lru_cache(maxsize=None)
+def policy_entropy(policy: Policy) -> float:
+    """
+    Exact Shannon entropy, in bits, of `generate_password(*policy)`.
+
+    Once the per-pool counts are fixed, the final shuffle makes every string
+    with those counts equally likely. So the entropy is the entropy of the
+    count vector plus the expected log of the number of such strings. The
+    at-least-one-per-class rule and the even split are both accounted for
+    through `count_vectors`.
+
+    Args:
+        policy: Policy to score.
+
+    Returns:
+        Entropy in bits; 0.0 (with an error emitted) if no categories are set.
+    """
+    pools, num_pools = generate_pools(*policy[1:])
+    if num_pools == 0:
+        return 0.0
+
+    sizes = [len(pool) for pool in pools]
+    bits = 0.0
+    for counts, p in count_vectors(policy.length, num_pools).items():
+        arrangements = math.factorial(sum(counts))
+        strings = 1
+        for c, n in zip(counts, sizes):
+            arrangements //= math.factorial(c)
+            strings *= n**c
+        bits += p * (math.log2(arrangements * strings) - math.log2(p))
+    return bits
+
+
+@lru_cache(maxsize=None)
+def policy_keyspace_bits(policy: Policy) -> float:
+    """
+    log2 of how many strings satisfy a policy, i.e. its brute-force keyspace.
+
+    Counts every string of the policy's length drawn from the enabled pools
+    that contains at least one character of each class, by
+    inclusion-exclusion. This is the entropy of a uniform choice over the
+    policy and an upper bound on `policy_entropy`.
+
+    Args:
+        policy: Policy to score.
+
+    Returns:
+        Keyspace size in bits; 0.0 (with an error emitted) if no categories
+        are set.
+    """
+    pools, num_pools = generate_pools(*policy[1:])
+    if num_pools == 0:
+        return 0.0
+
+    sizes = [len(pool) for pool in pools]
+    total = sum(sizes)
+    valid = 0
+    for k in range(num_pools + 1):
+        for excluded in combinations(sizes, k):
+            valid += (-1) ** k * (total - sum(excluded)) ** policy.length
+    return math.log2(valid) if valid > 0 else 0.0
+
+
+def repeated_blocks(password: str) -> Tuple[int, List[bool]]:
+    """
+    Find the parts of a string that copy text appearing earlier in it.
+
+    Scans left to right and, at each position, takes the longest block that
+    already occurred before it (overlaps allowed, so "abcabcabc" is "abc"
+    followed by one six-character copy). Blocks shorter than `MIN_REPEAT`
+    are ignored.
+
+    Args:
+        password: String to scan.
+
+    Returns:
+        (blocks, copied):
+            blocks — number of repeated blocks found.
+            copied — per character, True if it lies inside a repeated block.
+    """
+    n = len(password)
+    copied = [False] * n
+    blocks = 0
+    i = 1
+    while i < n:
+        size = 0
+        # The block may run into itself, but must start before position i.
+        while (
+            i + size < n and password.find(password[i : i + size + 1], 0, i + size) >= 0
+        ):
+            size += 1
+        if size >= MIN_REPEAT:
+            copied[i : i + size] = [True] * size
+            blocks += 1
+            i += size
+        else:
+            i += 1
+    return blocks, copied
+
+
+def score_password(password: str) -> float:
+    """
+    Heuristically estimate the strength of an arbitrary string in bits.
+
+    The alphabet size is taken from the character classes present. A
+    character that repeats its predecessor, continues an alphabetical or
+    numeric sequence, or walks along a keyboard row counts as one bit
+    rather than a full alphabet draw. A block that copies earlier text
+    ("Passw0rdPassw0rd") costs one bit in total, so only its first
+    occurrence is charged.
+
+    Args:
+        password: String to score.
+
+    Returns:
+        Estimated strength in bits.
+    """
+    if not password:
+        return 0.0
+
+    classes = set(password.translate(CLASS_TABLE))
+    alphabet = sum(CLASS_SIZES[c] for c in classes & CLASS_SIZES.keys())
+    # Untagged characters are left as-is by the table; count them once.
+    if classes - CLASS_SIZES.keys():
+        alphabet += OTHER_SIZE
+
+    blocks, copied = repeated_blocks(password)
+    predictable = sum(
+        pair in PREDICTABLE and not skip
+        for pair, skip in zip(map(str.__add__, password, password[1:]), copied[1:])
+    )
+    fresh = len(password) - sum(copied) - predictable
+    return fresh * math.log2(alphabet) + predictable + blocks
+
+
+@lru_cache(maxsize=None)
+def policy_pools(policy: Policy) -> Tuple[frozenset, Tuple[frozenset, ...]]:
+    """Return the allowed characters and each enabled pool of `policy` as sets."""
+    pools, _ = generate_pools(*policy[1:])
+    return frozenset("".join(pools)), tuple(frozenset(pool) for pool in pools)
+
+
+def matches_policy(password: str, policy: Policy) -> bool:
+    """
+    Check that a string could have been produced by `generate_password(*policy)`.
+
+    Args:
+        password: String to check.
+        policy: Policy it supposedly came from.
+
+    Returns:
+        bool: True if the length matches, every character is in an enabled
+        pool and every enabled pool is used at least once.
+    """
+    alphabet, pools = policy_pools(policy)
+    if len(password) != policy.length or not pools:
+        return False
+
+    chars = set(password)
+    if not chars <= alphabet:
+        return False
+    return all(not pool.isdisjoint(chars) for pool in pools)
+
+
+def score_passwords(
+    passwords: Iterable[str], policy: Optional[Policy] = None
+) -> List[float]:
+    """
+    Score a whole batch of credentials at once.
+
+    When a policy is given, every string that `matches_policy` gets the
+    policy's exact, cached entropy. Strings that could not have come from
+    that policy fall back to `score_password`, as does the whole batch when
+    no policy is given.
+
+    Args:
+        passwords: Credentials to score.
+        policy: Policy the batch was generated with, if known.
+
+    Returns:
+        One score in bits per password, in order.
+    """
+    if policy is None:
+        return list(map(score_password, passwords))
+
+    bits = policy_entropy(policy)
+    return [bits if matches_policy(p, policy) else score_password(p) for p in passwords]
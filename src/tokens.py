@@ -0,0 +1,168 @@
+import base64
+import binascii
+import os
+import zlib
+from typing import Callable, Dict, List, Tuple
+
+from src.ui import error_msg
+
+
+def b32(data: bytes) -> bytes:
+    """RFC 4648 base32 without padding."""
+    return base64.b32encode(data).rstrip(b"=")
+
+
+def b64url(data: bytes) -> bytes:
+    """URL-safe base64 without padding."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# Encoding name → (bulk encoder, input block size in bytes, output chars per block).
+# Whole blocks encode without padding, so block-aligned slices of one big encoded
+# buffer are identical to encoding each slice on its own.
+ENCODINGS: Dict[str, Tuple[Callable[[bytes], bytes], int, int]] = {
+    "hex": (binascii.hexlify, 1, 2),
+    "base32": (b32, 5, 8),
+    "base64url": (b64url, 3, 4),
+}
+
+# Bytes of CRC32 appended when a checksum is requested.
+CHECKSUM_BYTES = 4
+
+
+def encoded_length(nbytes: int, encoding: str) -> int:
+    """Return the number of characters `nbytes` encode to (padding stripped)."""
+    _, block, chars = ENCODINGS[encoding]
+    return -(-nbytes * chars // block)
+
+
+def record_size(nbytes: int, encoding: str) -> int:
+    """Round `nbytes` up to a whole number of the encoding's input blocks."""
+    block = ENCODINGS[encoding][1]
+    return -(-nbytes // block) * block
+
+
+def encode_records(buf: bytearray, nbytes: int, encoding: str) -> List[str]:
+    """
+    Encode a buffer of fixed-size records with a single encoder call.
+
+    Each record takes `record_size(nbytes, encoding)` bytes of `buf`, of which
+    only the first `nbytes` are kept. The rest is zeroed here, so every
+    returned string is exactly the unpadded encoding of its record's
+    `nbytes` bytes, whatever the block size.
+
+    Args:
+        buf: Records laid out back to back; modified in place.
+        nbytes: Bytes of each record to encode.
+        encoding: One of "hex", "base32" or "base64url".
+
+    Returns:
+        One encoded string per record.
+    """
+    encoder, block, chars = ENCODINGS[encoding]
+    size = record_size(nbytes, encoding)
+    for column in range(nbytes, size):
+        buf[column::size] = bytes(len(buf) // size)
+
+    width = encoded_length(nbytes, encoding)
+    step = size // block * chars
+    encoded = encoder(buf).decode("ascii")
+    return [encoded[i : i + width] for i in range(0, len(encoded), step)]
+
+
+def encode_checksum(body: str, encoding: str) -> str:
+    """Encode the CRC32 of `body` (as UTF-8) with the token's own encoding."""
+    encoder = ENCODINGS[encoding][0]
+    crc = zlib.crc32(body.encode("utf-8")).to_bytes(CHECKSUM_BYTES, "big")
+    return encoder(crc).decode("ascii")
+
+
+def generate_tokens(
+    count: int,
+    nbytes: int = 32,
+    encoding: str = "hex",
+    prefix: str = "",
+    checksum: bool = False,
+) -> List[str]:
+    """
+    Generate machine secrets (API keys, tokens) in bulk.
+
+    All randomness comes from a single `os.urandom` read, and all tokens (and
+    their checksums) are encoded with one encoder call each, whatever `nbytes`
+    is; see `encode_records`.
+
+    Args:
+        count: Number of tokens to generate.
+        nbytes: Random bytes per token.
+        encoding: One of "hex", "base32" or "base64url".
+        prefix: Text prepended to every token (e.g. "pf_").
+        checksum: Append a CRC32 of prefix + body, encoded like the body,
+            so leaked tokens can be recognised with `verify_token`.
+
+    Returns:
+        A list of `count` tokens, or an empty list (with an error emitted) if
+        the encoding or size is invalid.
+    """
+    if encoding not in ENCODINGS:
+        error_msg(f"Unknown token encoding '{encoding}'! Use: {', '.join(ENCODINGS)}")
+        return []
+    if nbytes < 1:
+        error_msg("Tokens need at least 1 random byte!")
+        return []
+
+    size = record_size(nbytes, encoding)
+    bodies = encode_records(bytearray(os.urandom(count * size)), nbytes, encoding)
+    if not checksum:
+        return [prefix + body for body in bodies] if prefix else bodies
+
+    # Same CRC32 as `encode_checksum`, resuming from the prefix's CRC and
+    # left-aligned in a zero-filled record so it bulk-encodes like the bodies.
+    seed = zlib.crc32(prefix.encode("utf-8"))
+    check_size = record_size(CHECKSUM_BYTES, encoding)
+    shift = 8 * (check_size - CHECKSUM_BYTES)
+    crcs = b"".join(
+        (zlib.crc32(body.encode("ascii"), seed) << shift).to_bytes(check_size, "big")
+        for body in bodies
+    )
+    checks = encode_records(bytearray(crcs), CHECKSUM_BYTES, encoding)
+    return [prefix + body + check for body, check in zip(bodies, checks)]
+
+
+def generate_token(
+    nbytes: int = 32, encoding: str = "hex", prefix: str = "", checksum: bool = False
+) -> str:
+    """
+    Generate a single machine secret.
+
+    Args:
+        nbytes: Random bytes in the token.
+        encoding: One of "hex", "base32" or "base64url".
+        prefix: Text prepended to the token.
+        checksum: Append a CRC32 checksum (see `generate_tokens`).
+
+    Returns:
+        The token, or an empty string if the settings are invalid.
+    """
+    tokens = generate_tokens(1, nbytes, encoding, prefix, checksum)
+    return tokens[0] if tokens else ""
+
+
+def verify_token(token: str, encoding: str = "hex", prefix: str = "") -> bool:
+    """
+    Check that a token carries the prefix and a valid trailing checksum.
+
+    Args:
+        token: Token to check, as produced with `checksum=True`.
+        encoding: Encoding the token was generated with.
+        prefix: Prefix the token was generated with.
+
+    Returns:
+        bool: True if the prefix matches and the checksum is correct.
+    """
+    if encoding not in ENCODINGS or not token.startswith(prefix):
+        return False
+
+    split = len(token) - encoded_length(CHECKSUM_BYTES, encoding)
+    if split <= len(prefix):
+        return False
+    return encode_checksum(token[:split], encoding) == token[split:]
@@ -1,9 +1,20 @@
+import os
 import subprocess
 import logging
 import platform
 import time
-from typing import Tuple
+from typing import Iterable, Tuple
 from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    ProgressColumn,
+    Task,
+    TextColumn,
+    TimeRemainingColumn,
+)
+from rich.text import Text
 
 console = Console()
 
@@ -216,3 +227,111 @@ def use_symbols() -> bool:
     """
     pause_action(1.6, True, False)
     return get_yes_no("Do you want to use symbols in your password? ")
+
+
+def get_batch_count() -> int:
+    """
+    Prompt for and validate how many passwords a batch should contain.
+
+    Returns:
+        int: Positive number of passwords to generate.
+    """
+    pause_action(1.6, True, False)
+
+    while True:
+        try:
+            count = int(input("How many passwords do you want to generate? "))
+        except ValueError:
+            error_msg("Please enter an integer!")
+            pause_action(2, True, True)
+            continue
+
+        if count <= 0:
+            error_msg("Please enter a number greater than 0!")
+            pause_action(2, True, True)
+            continue
+
+        success_msg(success)
+        pause_action(1.8, True, False)
+        return count
+
+
+def get_output_file() -> str:
+    """
+    Prompt for the file that a batch of passwords is written to.
+
+    An existing file is only accepted once the user agrees to overwrite it.
+
+    Returns:
+        str: Non-empty output file path.
+    """
+    pause_action(1.6, True, False)
+
+    while True:
+        path = input("Which file should the passwords be saved to? ").strip()
+        if not path:
+            error_msg("Please enter a file name!")
+            pause_action(2, True, True)
+            continue
+
+        if os.path.exists(path):
+            caution_msg(f"{path} already exists and will be overwritten!")
+            if not get_yes_no("Overwrite it? (y/n) "):
+                continue
+            return path
+
+        success_msg(success)
+        pause_action(1.8, True, False)
+        return path
+
+
+def get_profile_name(names: Iterable[str]) -> str:
+    """
+    Prompt user to pick one of the configured policy profiles.
+
+    Args:
+        names (Iterable[str]): Profile names available in the config.
+
+    Returns:
+        str: The chosen profile name.
+    """
+    names = list(names)
+    pause_action(1.6, True, False)
+
+    while True:
+        console.print(f"Available profiles: {', '.join(names)}")
+        name = input("Which profile do you want to use? ").strip()
+        if name in names:
+            success_msg(success)
+            pause_action(1.8, True, False)
+            return name
+
+        error_msg("Please enter one of the listed profiles!")
+        pause_action(2, True, True)
+
+
+class RateColumn(ProgressColumn):
+    """Render how many items per second a task is completing."""
+
+    def render(self, task: Task) -> Text:
+        speed = task.speed
+        if speed is None:
+            return Text("-- /s", style="progress.data.speed")
+        return Text(f"{speed:,.0f}/s", style="progress.data.speed")
+
+
+def batch_progress() -> Progress:
+    """
+    Build the progress display used while a batch is being generated.
+
+    Returns:
+        Progress: Display showing completed count, rate and time remaining.
+    """
+    return Progress(
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        RateColumn(),
+        TimeRemainingColumn(),
+        console=console,
+    )
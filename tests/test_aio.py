@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from unittest.mock import patch
+from aio import aiter_batches, aiter_passwords, agenerate_passwords, generate_sliced
+from generator import Policy, generate_passwords
+
+
+class TestAsyncGeneration(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the asyncio API.
+
+    These tests confirm:
+        - Awaitable and iterator forms produce exactly the requested passwords.
+        - Batches respect the batch size and the total count.
+        - Breaking out early or cancelling the consumer shuts down cleanly,
+          stopping a prefetched batch that is already running.
+    """
+
+    async def test_agenerate_passwords(self):
+        passwords = await agenerate_passwords(1000, 20, batch_size=64)
+        self.assertEqual(len(passwords), 1000)
+        self.assertTrue(all(len(p) == 20 for p in passwords))
+
+    async def test_aiter_batches_sizes(self):
+        sizes = [
+            len(batch)
+            async for batch in aiter_batches(Policy(12), count=250, batch_size=100)
+        ]
+        self.assertEqual(sizes, [100, 100, 50])
+
+    async def test_aiter_passwords_policy(self):
+        policy = Policy(10, False, False, True, False)
+        passwords = [p async for p in aiter_passwords(policy, count=300)]
+        self.assertEqual(len(passwords), 300)
+        self.assertTrue(all(p.isdigit() and len(p) == 10 for p in passwords))
+
+    async def test_unbounded_iterator_break(self):
+        seen = 0
+        passwords = aiter_passwords(batch_size=16)
+        async for _ in passwords:
+            seen += 1
+            if seen == 40:
+                break
+        await passwords.aclose()
+        self.assertEqual(seen, 40)
+
+    async def test_cancel_consumer(self):
+        async def consume():
+            async for _ in aiter_passwords(batch_size=32):
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+    async def test_cancel_stops_running_batch(self):
+        started = threading.Event()
+        calls = 0
+
+        def counting(*args):
+            nonlocal calls
+            calls += 1
+            started.set()
+            return generate_passwords(*args)
+
+        async def consume():
+            async for _ in aiter_batches(batch_size=10**5, executor=executor):
+                pass
+
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=1)
+        with patch("aio.generate_passwords", side_effect=counting):
+            task = asyncio.create_task(consume())
+            # Let the batch start running before cancelling the consumer.
+            self.assertTrue(await loop.run_in_executor(None, started.wait, 10))
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            await loop.run_in_executor(None, executor.shutdown, True)
+        # Without the stop event the job would run on for ~12,500 slices.
+        self.assertLess(calls, 1000)
+
+    def test_generate_sliced_stop(self):
+        stop = threading.Event()
+        stop.set()
+        self.assertEqual(generate_sliced(Policy(), 100, stop), [])
+        self.assertEqual(len(generate_sliced(Policy(), 100)), 100)
+
+    async def test_no_categories(self):
+        with patch("sys.stdout", new=StringIO()):
+            passwords = await agenerate_passwords(10, 12, False, False, False, False)
+        self.assertEqual(passwords, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import os
+import stat
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from io import StringIO
+from batch import open_output, start_batch, write_batch
+from generator import generate_passwords
+from main import generate_batch
+
+
+class TestGeneratePasswords(unittest.TestCase):
+    """Tests for `generate_passwords`, the bulk wrapper around generation."""
+
+    def test_generate_passwords_count_and_length(self):
+        passwords = generate_passwords(50, 14)
+        self.assertEqual(len(passwords), 50)
+        self.assertTrue(all(len(p) == 14 for p in passwords))
+
+    def test_generate_passwords_no_categories(self):
+        with patch("sys.stdout", new=StringIO()):
+            passwords = generate_passwords(5, 12, False, False, False, False)
+        self.assertEqual(passwords, [])
+
+
+class TestWriteBatch(unittest.TestCase):
+    """
+    Tests for `write_batch` and `start_batch`.
+
+    These tests confirm:
+        - Exactly the requested number of lines is written.
+        - Progress callbacks add up to the number written.
+        - A set stop event ends the batch without losing written lines.
+        - A failing background worker reports its error instead of dying.
+    """
+
+    def test_write_batch_writes_count_lines(self):
+        out = StringIO()
+        progress = []
+        written = write_batch(
+            out, 1000, generate_passwords, on_progress=progress.append, chunk_size=64
+        )
+        lines = out.getvalue().splitlines()
+        self.assertEqual(written, 1000)
+        self.assertEqual(len(lines), 1000)
+        self.assertEqual(sum(progress), 1000)
+        self.assertTrue(all(len(line) == 16 for line in lines))
+
+    def test_write_batch_stops_when_event_set(self):
+        out = StringIO()
+        stop = threading.Event()
+
+        def produce(n):
+            # Cancel while the second chunk is being produced.
+            if out.getvalue():
+                stop.set()
+            return ["x"] * n
+
+        written = write_batch(out, 1000, produce, stop, chunk_size=10)
+        self.assertEqual(written, 20)
+        self.assertEqual(out.getvalue().splitlines(), ["x"] * 20)
+
+    def test_write_batch_empty_producer(self):
+        out = StringIO()
+        self.assertEqual(write_batch(out, 10, lambda n: []), 0)
+        self.assertEqual(out.getvalue(), "")
+
+    def test_start_batch_runs_in_background(self):
+        out = StringIO()
+        worker, stop, errors = start_batch(out, 300, generate_passwords)
+        worker.join(10)
+        self.assertFalse(worker.is_alive())
+        self.assertFalse(stop.is_set())
+        self.assertEqual(errors, [])
+        self.assertEqual(len(out.getvalue().splitlines()), 300)
+
+    def test_start_batch_captures_worker_error(self):
+        def produce(n):
+            raise OSError(28, "No space left on device")
+
+        worker, _, errors = start_batch(StringIO(), 10, produce)
+        worker.join(10)
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], OSError)
+
+
+class TestGenerateBatch(unittest.TestCase):
+    """Tests for the interactive `generate_batch` flow."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "passwords.txt")
+
+    def test_saves_batch(self):
+        with patch("sys.stdout", new=StringIO()):
+            message = generate_batch(500, self.path, 12, True, True, True, False)
+        self.assertEqual(message, f"Saved 500 passwords to {self.path}.")
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(len(f.read().splitlines()), 500)
+
+    def test_reports_worker_failure(self):
+        disk_full = OSError(28, "No space left on device")
+        with patch("sys.stdout", new=StringIO()), patch(
+            "main.generate_passwords", side_effect=disk_full
+        ):
+            message = generate_batch(500, self.path, 12, True, True, True, False)
+        self.assertTrue(message.startswith("Batch generation failed"))
+        self.assertIn("No space left on device", message)
+
+
+class TestOpenOutput(unittest.TestCase):
+    """Tests for `open_output`, which creates batch output files."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "passwords.txt")
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions only")
+    def test_new_file_is_private(self):
+        with open_output(self.path) as out:
+            out.write("secret\n")
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+    def test_existing_file_is_truncated(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("old contents\n")
+        with open_output(self.path) as out:
+            out.write("new\n")
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "new\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
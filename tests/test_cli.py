@@ -0,0 +1,65 @@
+import os
+import stat
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
+from main import run_cli
+
+CONFIG = """
+[profiles.wifi]
+length = 20
+
+[profiles.bad]
+length = 3
+"""
+
+
+class TestRunCli(unittest.TestCase):
+    """
+    Tests for the scripted command-line path.
+
+    These tests confirm:
+        - stdout carries generated items only; diagnostics go to stderr.
+        - The exit code reflects whether generation succeeded.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.config = os.path.join(self.tmp.name, "passforge.toml")
+        with open(self.config, "w", encoding="utf-8") as f:
+            f.write(CONFIG)
+
+    def run_cli(self, *argv):
+        with patch("sys.stdout", new=StringIO()) as out, patch(
+            "sys.stderr", new=StringIO()
+        ) as err:
+            rc = run_cli(list(argv))
+        return rc, out.getvalue(), err.getvalue()
+
+    def test_profile_diagnostics_go_to_stderr(self):
+        rc, out, err = self.run_cli("-p", "wifi", "-c", self.config, "-n", "3")
+        self.assertEqual(rc, 0)
+        self.assertEqual([len(line) for line in out.splitlines()], [20, 20, 20])
+        self.assertIn("Profile 'bad'", err)
+
+    def test_unknown_profile(self):
+        rc, out, err = self.run_cli("-p", "nope", "-c", self.config)
+        self.assertEqual(rc, 1)
+        self.assertEqual(out, "")
+        self.assertIn("Unknown profile 'nope'", err)
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions only")
+    def test_output_file_is_private(self):
+        path = os.path.join(self.tmp.name, "tokens.txt")
+        rc, out, _ = self.run_cli("-t", "hex", "-n", "5", "-o", path)
+        self.assertEqual(rc, 0)
+        self.assertEqual(out, "")
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(len(f.read().splitlines()), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
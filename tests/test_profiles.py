@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
+import profiles
+from generator import Policy, generate_password
+from profiles import get_profile, load_profiles
+
+TOML_CONFIG = """
+[profiles.wifi]
+length = 20
+symbols = false
+
+[profiles.db-root]
+length = 32
+
+[profiles.too-short]
+length = 4
+"""
+
+JSON_CONFIG = '{"profiles": {"api-user": {"length": 40, "upper": false}}}'
+
+
+class TestProfiles(unittest.TestCase):
+    """
+    Tests for loading named policy profiles.
+
+    These tests confirm:
+        - TOML and JSON configs compile into `Policy` tuples with defaults filled.
+        - Invalid profiles are skipped with an error.
+        - Parsed configs are cached until the file changes.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_load_toml_profiles(self):
+        path = self.write("passforge.toml", TOML_CONFIG)
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            loaded = load_profiles(path)
+
+        self.assertEqual(loaded["wifi"], Policy(20, True, True, True, False))
+        self.assertEqual(loaded["db-root"], Policy(32))
+        self.assertNotIn("too-short", loaded)
+        self.assertIn("too-short", fake_out.getvalue())
+
+    def test_load_json_profiles(self):
+        path = self.write("passforge.json", JSON_CONFIG)
+        policy = get_profile("api-user", path)
+        self.assertEqual(policy, Policy(40, False, True, True, True))
+
+    def test_unknown_profile(self):
+        path = self.write("passforge.json", JSON_CONFIG)
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            policy = get_profile("wifi", path)
+        self.assertIsNone(policy)
+        self.assertIn("Unknown profile 'wifi'", fake_out.getvalue())
+
+    def test_missing_config(self):
+        path = os.path.join(self.tmp.name, "missing.toml")
+        with patch("sys.stdout", new=StringIO()):
+            self.assertEqual(load_profiles(path), {})
+
+    def test_profiles_cached_until_modified(self):
+        path = self.write("passforge.json", JSON_CONFIG)
+        with patch("profiles.parse_config", wraps=profiles.parse_config) as parse:
+            load_profiles(path)
+            load_profiles(path)
+            self.assertEqual(parse.call_count, 1)
+
+            self.write("passforge.json", JSON_CONFIG.replace("40", "48"))
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            self.assertEqual(load_profiles(path)["api-user"].length, 48)
+            self.assertEqual(parse.call_count, 2)
+
+    def test_parse_errors_not_cached(self):
+        path = self.write("passforge.toml", "[profiles.wifi\nlength = 20\n")
+        for _ in range(2):
+            with patch("sys.stdout", new=StringIO()) as fake_out:
+                self.assertEqual(load_profiles(path), {})
+            self.assertIn("malformed", fake_out.getvalue())
+
+    def test_profile_errors_reported_once(self):
+        path = self.write("passforge.toml", TOML_CONFIG)
+        with patch("profiles.parse_config", wraps=profiles.parse_config) as parse:
+            with patch("sys.stdout", new=StringIO()) as fake_out:
+                load_profiles(path)
+                self.assertIn("wifi", load_profiles(path))
+            self.assertEqual(parse.call_count, 1)
+        self.assertEqual(fake_out.getvalue().count("too-short"), 1)
+
+    def test_invalid_profile_lookup(self):
+        path = self.write("passforge.toml", TOML_CONFIG)
+        with patch("sys.stdout", new=StringIO()):
+            load_profiles(path)
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            self.assertIsNone(get_profile("too-short", path))
+        self.assertIn("length must be greater than 6", fake_out.getvalue())
+
+    def test_profile_generates_password(self):
+        path = self.write("passforge.toml", TOML_CONFIG)
+        with patch("sys.stdout", new=StringIO()):
+            policy = get_profile("wifi", path)
+        password = generate_password(*policy)
+        self.assertEqual(len(password), 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
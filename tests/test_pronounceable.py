@@ -0,0 +1,102 @@
+import math
+import unittest
+from collections import Counter
+from io import StringIO
+from unittest.mock import patch
+from generator import symbols_pool
+from pronounceable import (
+    build_alias,
+    letters_entropy,
+    markov_tables,
+    pronounceable_entropy,
+    pronounceable_password,
+    sample_letters,
+)
+
+
+class TestBuildAlias(unittest.TestCase):
+    """Tests for the exact integer alias tables."""
+
+    def test_alias_table_is_exact(self):
+        for counts in ([1], [5, 1, 3, 7], [2, 2, 2], [100, 1], [1, 1, 1, 1, 9]):
+            threshold, alias = build_alias(counts)
+            total = sum(counts)
+            hits = Counter()
+
+            # Enumerate every (slot, u) pair the sampler can draw.
+            for slot in range(len(counts)):
+                for u in range(total):
+                    hits[slot if u < threshold[slot] else alias[slot]] += 1
+
+            expected = {i: c * len(counts) for i, c in enumerate(counts)}
+            self.assertEqual(dict(hits), expected)
+
+
+class TestPronounceablePassword(unittest.TestCase):
+    """
+    Tests for `pronounceable_password`.
+
+    These tests confirm:
+        - Passwords have the requested length and character classes.
+        - Reported bits match the probability of the sampled string.
+        - Invalid settings return an empty password with an error.
+    """
+
+    def test_length(self):
+        for length in (7, 12, 16, 64):
+            for _ in range(100):
+                password, _ = pronounceable_password(length, use_symbols=True)
+                self.assertEqual(len(password), length)
+
+    def test_character_classes(self):
+        for _ in range(200):
+            p, _ = pronounceable_password(16, True, True, True, True)
+            self.assertTrue(p[0].isupper() or not p[0].isalpha())
+            self.assertEqual(sum(c.isdigit() for c in p), 1)
+            self.assertEqual(sum(c in symbols_pool for c in p), 1)
+            self.assertEqual(sum(c.isupper() for c in p), 1)
+
+    def test_single_case(self):
+        for _ in range(100):
+            p, _ = pronounceable_password(12, True, False, False, False)
+            self.assertTrue(p.isalpha() and p.isupper())
+            p, _ = pronounceable_password(12, False, True, False, False)
+            self.assertTrue(p.isalpha() and p.islower())
+
+    def test_bits_match_path_probability(self):
+        tables = markov_tables()
+        letters, bits = sample_letters(10, tables)
+
+        # Re-walk the chain and multiply the exact transition probabilities.
+        ctx, prob = tables.start, 1.0
+        for letter in letters:
+            base = tables.offsets[ctx]
+            entries = range(base, base + tables.sizes[ctx])
+            entry = next(e for e in entries if tables.chars[e] == ord(letter))
+            prob *= 2.0 ** -tables.info[entry]
+            ctx = tables.following[entry]
+
+        self.assertAlmostEqual(bits, -math.log2(prob))
+
+    def test_entropy_is_mean_self_information(self):
+        samples = [pronounceable_password(12)[1] for _ in range(4000)]
+        mean = sum(samples) / len(samples)
+        self.assertAlmostEqual(mean, pronounceable_entropy(12), delta=0.5)
+
+    def test_entropy_grows_with_length(self):
+        self.assertEqual(letters_entropy(0), 0.0)
+        self.assertLess(letters_entropy(8), letters_entropy(16))
+
+    def test_no_letters(self):
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            self.assertEqual(pronounceable_password(16, False, False), ("", 0.0))
+        self.assertIn("need letters", fake_out.getvalue())
+
+    def test_too_short(self):
+        with patch("sys.stdout", new=StringIO()):
+            result = pronounceable_password(2, use_digits=True, use_symbols=True)
+        self.assertEqual(result, ("", 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import math
+import unittest
+from collections import Counter
+from generator import Policy, generate_password, generate_pools
+from strength import (
+    count_vectors,
+    policy_entropy,
+    policy_keyspace_bits,
+    repeated_blocks,
+    score_password,
+    score_passwords,
+)
+
+
+class TestPolicyEntropy(unittest.TestCase):
+    """
+    Tests for the exact policy entropy calculations.
+
+    These tests confirm:
+        - Single-pool policies reduce to length * log2(pool size).
+        - The keyspace count applies the at-least-one-per-class rule.
+        - The count-vector distribution matches `generate_password`.
+    """
+
+    def test_single_pool(self):
+        policy = Policy(12, False, False, True, False)
+        self.assertAlmostEqual(policy_entropy(policy), 12 * math.log2(10))
+        self.assertAlmostEqual(policy_keyspace_bits(policy), 12 * math.log2(10))
+
+    def test_keyspace_requires_every_class(self):
+        # Length 2 with uppercase and digits: one of each, in either order.
+        policy = Policy(2, True, False, True, False)
+        self.assertAlmostEqual(policy_keyspace_bits(policy), math.log2(2 * 26 * 10))
+
+    def test_entropy_below_keyspace(self):
+        for length in (7, 12, 16, 33):
+            policy = Policy(length)
+            self.assertLess(policy_entropy(policy), policy_keyspace_bits(policy))
+
+    def test_count_vectors_distribution(self):
+        for length, flags in (
+            (7, (True, True, True, True)),
+            (10, (True, True, True, False)),
+        ):
+            pools, num_pools = generate_pools(*flags)
+            dist = count_vectors(length, num_pools)
+            self.assertAlmostEqual(sum(dist.values()), 1.0)
+            self.assertTrue(all(min(v) >= 1 and sum(v) == length for v in dist))
+
+            samples = 5000
+            seen = Counter()
+            for _ in range(samples):
+                password = generate_password(length, *flags)
+                seen[tuple(sum(c in pool for c in password) for pool in pools)] += 1
+            for vec in set(seen) | set(dist):
+                self.assertAlmostEqual(
+                    seen[vec] / samples, dist.get(vec, 0.0), delta=0.03
+                )
+
+
+class TestScorePassword(unittest.TestCase):
+    """Tests for heuristic scoring of arbitrary strings and batches."""
+
+    def test_patterns_score_lower(self):
+        self.assertLess(score_password("aaaaaaaa"), score_password("aqzmwkxp"))
+        self.assertLess(score_password("abcdefgh"), score_password("aqzmwkxp"))
+        self.assertLess(score_password("qwertyui"), score_password("aqzmwkxp"))
+        self.assertLess(score_password("12345678"), score_password("72918364"))
+
+    def test_repeats_score_lower(self):
+        random = score_password("vT7#qLm2!zR8wP4s")
+        self.assertLess(score_password("xK9!xK9!xK9!xK9!"), random / 2)
+        # Doubling a password adds about one bit, not another full password.
+        self.assertAlmostEqual(
+            score_password("Passw0rdPassw0rd"), score_password("Passw0rd") + 1
+        )
+        self.assertAlmostEqual(
+            score_password("abc!Xq9abc"), score_password("abc!Xq9") + 1
+        )
+
+    def test_repeated_blocks(self):
+        self.assertEqual(repeated_blocks("vT7#qLm2!zR8wP4s")[0], 0)
+        blocks, copied = repeated_blocks("xK9!xK9!xK9!")
+        self.assertEqual(blocks, 1)
+        self.assertEqual(copied, [False] * 4 + [True] * 8)
+        # Two-character repeats are too short to count.
+        self.assertEqual(repeated_blocks("abXab")[0], 0)
+
+    def test_more_classes_score_higher(self):
+        self.assertLess(score_password("kdpqmzxw"), score_password("kdPqm7x!"))
+
+    def test_empty(self):
+        self.assertEqual(score_password(""), 0.0)
+
+    def test_score_batch(self):
+        passwords = ["aaaaaaaa", "kdPqm7x!"]
+        self.assertEqual(
+            score_passwords(passwords), [score_password(p) for p in passwords]
+        )
+
+    def test_score_batch_with_policy(self):
+        policy = Policy(16)
+        passwords = [generate_password(*policy) for _ in range(10)]
+        self.assertEqual(
+            score_passwords(passwords, policy), [policy_entropy(policy)] * 10
+        )
+
+    def test_score_batch_with_policy_rejects_foreign_strings(self):
+        policy = Policy(8, True, True, True, False)
+        foreign = ["short1A", "abcdefg!A1", "abcd!fA1", "abcdefgh"]
+        self.assertEqual(
+            score_passwords(foreign, policy), [score_password(p) for p in foreign]
+        )
+        self.assertEqual(
+            score_passwords(["abcdefA1"], policy), [policy_entropy(policy)]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
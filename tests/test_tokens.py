@@ -0,0 +1,106 @@
+import base64
+import re
+import unittest
+from io import StringIO
+from unittest.mock import patch
+from tokens import (
+    ENCODINGS,
+    encode_checksum,
+    encoded_length,
+    generate_token,
+    generate_tokens,
+    verify_token,
+)
+
+ALPHABETS = {
+    "hex": re.compile(r"\A[0-9a-f]+\Z"),
+    "base32": re.compile(r"\A[A-Z2-7]+\Z"),
+    "base64url": re.compile(r"\A[A-Za-z0-9_-]+\Z"),
+}
+
+
+class TestGenerateTokens(unittest.TestCase):
+    """
+    Tests for the token fast path.
+
+    These tests confirm:
+        - Tokens have the expected length and alphabet for every encoding
+          and size, including sizes that are not whole encoding blocks.
+        - Decoding a token gives back exactly `nbytes` bytes.
+        - Checksums verify and catch tampering.
+    """
+
+    def test_length_and_alphabet(self):
+        for encoding, alphabet in ALPHABETS.items():
+            for nbytes in (1, 15, 16, 30, 32):
+                tokens = generate_tokens(200, nbytes, encoding)
+                self.assertEqual(len(tokens), 200)
+                for token in tokens:
+                    self.assertEqual(len(token), encoded_length(nbytes, encoding))
+                    self.assertRegex(token, alphabet)
+                self.assertNotRegex(tokens[0] + "=", alphabet)
+
+    def test_decodes_to_nbytes(self):
+        for nbytes in (15, 16):
+            for token in generate_tokens(50, nbytes, "hex"):
+                self.assertEqual(len(bytes.fromhex(token)), nbytes)
+            for token in generate_tokens(50, nbytes, "base64url"):
+                padded = token + "=" * (-len(token) % 4)
+                self.assertEqual(len(base64.urlsafe_b64decode(padded)), nbytes)
+            for token in generate_tokens(50, nbytes, "base32"):
+                padded = token + "=" * (-len(token) % 8)
+                self.assertEqual(len(base64.b32decode(padded)), nbytes)
+
+    def test_canonical_encoding(self):
+        # Block padding must not leak into the last character of a token.
+        decoders = {
+            "hex": bytes.fromhex,
+            "base32": lambda t: base64.b32decode(t + "=" * (-len(t) % 8)),
+            "base64url": lambda t: base64.urlsafe_b64decode(t + "=" * (-len(t) % 4)),
+        }
+        for encoding, decode in decoders.items():
+            encoder = ENCODINGS[encoding][0]
+            for nbytes in (1, 2, 4, 31, 32):
+                for token in generate_tokens(50, nbytes, encoding):
+                    self.assertEqual(encoder(decode(token)).decode("ascii"), token)
+
+    def test_tokens_unique(self):
+        tokens = generate_tokens(10000, 16)
+        self.assertEqual(len(set(tokens)), len(tokens))
+
+    def test_prefix_and_checksum(self):
+        for encoding in ENCODINGS:
+            for token in generate_tokens(100, 32, encoding, "pf_", True):
+                self.assertTrue(token.startswith("pf_"))
+                self.assertTrue(verify_token(token, encoding, "pf_"))
+
+    def test_checksum_matches_single_encoding(self):
+        for encoding in ENCODINGS:
+            for nbytes in (1, 16, 32):
+                for token in generate_tokens(50, nbytes, encoding, "pf_", True):
+                    split = len("pf_") + encoded_length(nbytes, encoding)
+                    self.assertEqual(
+                        token[split:], encode_checksum(token[:split], encoding)
+                    )
+
+    def test_checksum_non_ascii_prefix(self):
+        token = generate_token(16, "base64url", "é_", True)
+        self.assertTrue(verify_token(token, "base64url", "é_"))
+
+    def test_checksum_detects_tampering(self):
+        token = generate_token(32, "hex", "pf_", True)
+        flipped = "0" if token[5] != "0" else "1"
+        tampered = token[:5] + flipped + token[6:]
+        self.assertFalse(verify_token(tampered, "hex", "pf_"))
+        self.assertFalse(verify_token(token, "hex", "xx_"))
+        self.assertFalse(verify_token(generate_token(32, "hex", "pf_"), "hex", "pf_"))
+
+    def test_invalid_settings(self):
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            self.assertEqual(generate_tokens(5, 32, "base58"), [])
+            self.assertEqual(generate_token(0), "")
+        self.assertIn("Unknown token encoding", fake_out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()